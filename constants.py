@@ -26,3 +26,6 @@ from pathlib import Path
 BASE_DIR = Path(__file__).resolve().parent
 LOGS_DIR = BASE_DIR / "logs"
 
+# SQLite store for persisted analysis results
+FINDINGS_DB = os.environ.get("LOG_ANALYZER_DB") or str(BASE_DIR / "findings.db")
+
@@ -0,0 +1,321 @@
+# findings_store.py
+
+import re
+import json
+import sqlite3
+import hashlib
+from datetime import datetime
+from collections import Counter
+from typing import List, Dict, Any, Tuple
+
+from constants import FINDINGS_DB
+from log_reader import parse_time
+
+
+# Bumped whenever SCHEMA changes; stored in PRAGMA user_version
+SCHEMA_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS findings (
+    id            INTEGER PRIMARY KEY,
+    analyzed_at   TEXT NOT NULL,
+    file_name     TEXT NOT NULL,
+    window_start  TEXT NOT NULL,
+    window_end    TEXT NOT NULL,
+    severity      TEXT NOT NULL,
+    category      TEXT NOT NULL,
+    fingerprint   TEXT NOT NULL,
+    summary       TEXT,
+    highlights    TEXT
+);
+-- findings only serves what the rollups cannot: minute buckets, bounds
+-- inside an hour and distinct-incident counts.
+CREATE INDEX IF NOT EXISTS idx_findings_start ON findings (window_start);
+CREATE INDEX IF NOT EXISTS idx_findings_file_start ON findings (file_name, window_start);
+
+-- Daily and hourly rollups kept in step with findings, so counts and
+-- trends over millions of rows only read a few thousand.
+CREATE TABLE IF NOT EXISTS finding_counts_daily (
+    day        TEXT NOT NULL,
+    file_name  TEXT NOT NULL,
+    severity   TEXT NOT NULL,
+    category   TEXT NOT NULL,
+    n          INTEGER NOT NULL,
+    PRIMARY KEY (day, file_name, severity, category)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_counts_daily_category ON finding_counts_daily (category, day, n);
+
+CREATE TABLE IF NOT EXISTS finding_counts (
+    hour       TEXT NOT NULL,
+    file_name  TEXT NOT NULL,
+    severity   TEXT NOT NULL,
+    category   TEXT NOT NULL,
+    n          INTEGER NOT NULL,
+    PRIMARY KEY (hour, file_name, severity, category)
+) WITHOUT ROWID;
+"""
+
+# Version 1 had wide covering indexes and no daily rollup
+MIGRATE_V1 = """
+DROP INDEX IF EXISTS idx_findings_time;
+DROP INDEX IF EXISTS idx_findings_file;
+DROP INDEX IF EXISTS idx_findings_severity;
+DROP INDEX IF EXISTS idx_findings_category;
+DROP INDEX IF EXISTS idx_findings_fingerprint;
+DROP INDEX IF EXISTS idx_counts_category;
+INSERT INTO finding_counts_daily (day, file_name, severity, category, n)
+    SELECT substr(hour, 1, 10), file_name, severity, category, SUM(n)
+    FROM finding_counts GROUP BY 1, 2, 3, 4;
+"""
+
+# Rollup tables, coarsest first: (table, time column, prefix length)
+ROLLUPS = [
+    ("finding_counts_daily", "day", 10),
+    ("finding_counts", "hour", 13),
+]
+
+# Histogram bucket -> length of the 'YYYY-MM-DD HH:MM:SS' prefix to group on
+BUCKET_PREFIX = {"month": 7, "day": 10, "hour": 13, "minute": 16}
+
+# Their tails complete a partial since/until bound, so both query paths
+# see the same range.
+_MIN_TIME = "0000-01-01 00:00:00"
+_MAX_TIME = "9999-12-31 23:59:59"
+
+_TIMESTAMP_RE = re.compile(r"^\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}\s*")
+_NUMBER_RE = re.compile(r"\d+")
+
+
+def incident_fingerprint(result: Dict[str, Any]) -> str:
+    """
+    Stable id for an incident: same file, category and highlight lines
+    (ignoring timestamps and numbers) give the same fingerprint.
+    """
+    highlights = [
+        _NUMBER_RE.sub("#", _TIMESTAMP_RE.sub("", str(h)))
+        for h in result.get("error_highlights") or []
+    ]
+    key = "\n".join([result.get("file_name") or "", _label(result.get("category"))] + highlights)
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+def normalize_time(value: str, fill: str = _MIN_TIME) -> str:
+    """
+    Returns value as 'YYYY-MM-DD HH:MM:SS'. A partial 'YYYY-MM-DD',
+    'YYYY-MM-DD HH' or 'YYYY-MM-DD HH:MM' is completed from fill.
+    """
+    text = value.strip().replace("T", " ")
+    if len(text) in (10, 13, 16):
+        text += fill[len(text):]
+    try:
+        return parse_time(text).strftime("%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        raise ValueError(f"Invalid time '{value}', expected 'YYYY-MM-DD[ HH[:MM[:SS]]]'.") from None
+
+
+def _label(value: Any) -> str:
+    """
+    Upper-cased severity/category, 'UNKNOWN' when the model left it out.
+    """
+    return str(value).strip().upper() if value else "UNKNOWN"
+
+
+class FindingsStore:
+    """
+    Persists analysis results in SQLite and answers count/trend queries
+    from the indexes, without re-reading logs or calling the LLM.
+    Times are stored as 'YYYY-MM-DD HH:MM:SS' text, which sorts chronologically.
+
+    Queries whose bounds fall on whole days or hours are answered from the
+    daily or hourly rollup; anything finer, and distinct-incident counts,
+    fall back to the findings table.
+    """
+
+    def __init__(self, db_path: str = FINDINGS_DB):
+        self.db_path = str(db_path)
+        self.conn = sqlite3.connect(self.db_path)
+        # Only a fresh database pays for the schema script; WAL mode is
+        # persisted in the file, so it is set once here as well.
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < SCHEMA_VERSION:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.executescript(
+                "BEGIN;"
+                + SCHEMA
+                + (MIGRATE_V1 if version == 1 else "")
+                + f"PRAGMA user_version = {SCHEMA_VERSION}; COMMIT;"
+            )
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def add_many(self, analyses: List[Dict[str, Any]]) -> int:
+        """
+        Inserts all analysis dicts in a single transaction.
+        Missing or null fields from the model are stored as 'UNKNOWN'.
+        Returns the number of rows written.
+        """
+        analyzed_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        rows = []
+        rollup: Counter = Counter()
+        for result in analyses:
+            tw = result.get("time_window") or {}
+            file_name = result.get("file_name") or "UNKNOWN"
+            window_start = tw.get("start") or ""
+            window_end = tw.get("end") or ""
+            if window_start:
+                window_start = normalize_time(window_start)
+            if window_end:
+                window_end = normalize_time(window_end, _MAX_TIME)
+            severity = _label(result.get("severity"))
+            category = _label(result.get("category"))
+            rows.append((
+                analyzed_at,
+                file_name,
+                window_start,
+                window_end,
+                severity,
+                category,
+                incident_fingerprint(result),
+                result.get("ai_summary") or "",
+                json.dumps(result.get("error_highlights") or []),
+            ))
+            for _, _, prefix in ROLLUPS:
+                rollup[(prefix, window_start[:prefix], file_name, severity, category)] += 1
+
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO findings (analyzed_at, file_name, window_start, window_end,"
+                " severity, category, fingerprint, summary, highlights)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            for table, time_col, prefix in ROLLUPS:
+                self.conn.executemany(
+                    f"INSERT INTO {table} ({time_col}, file_name, severity, category, n)"
+                    " VALUES (?, ?, ?, ?, ?)"
+                    f" ON CONFLICT ({time_col}, file_name, severity, category) DO UPDATE SET n = n + excluded.n",
+                    [key[1:] + (n,) for key, n in rollup.items() if key[0] == prefix],
+                )
+        return len(rows)
+
+    @staticmethod
+    def _rollup_for(since: str = None, until: str = None, bucket: str = "month") -> Tuple[str, str, int] | None:
+        """
+        The coarsest rollup that answers the query exactly, or None when
+        it needs the findings table. since/until must be normalized.
+        """
+        for table, time_col, prefix in ROLLUPS:
+            if BUCKET_PREFIX[bucket] > prefix:
+                continue
+            if since and since[prefix:] != _MIN_TIME[prefix:]:
+                continue
+            if until and until[prefix:] != _MAX_TIME[prefix:]:
+                continue
+            return table, time_col, prefix
+        return None
+
+    def _where(
+        self,
+        time_col: str,
+        prefix: int,
+        since: str = None,
+        until: str = None,
+        file_name: str = None,
+        severity: str = None,
+        category: str = None,
+    ) -> Tuple[str, List[Any]]:
+        clauses, params = [], []
+        if since:
+            clauses.append(f"{time_col} >= ?")
+            params.append(since[:prefix])
+        if until:
+            clauses.append(f"{time_col} <= ?")
+            params.append(until[:prefix])
+        if file_name:
+            clauses.append("file_name = ?")
+            params.append(file_name)
+        if severity:
+            clauses.append("severity = ?")
+            params.append(severity.upper())
+        if category:
+            clauses.append("category = ?")
+            params.append(category.upper())
+        where = " WHERE " + " AND ".join(clauses) if clauses else ""
+        return where, params
+
+    def _query(
+        self,
+        select: str,
+        tail: str,
+        bucket: str,
+        filters: Dict[str, Any],
+        extra: List[Any] = (),
+        rollups: bool = True,
+    ):
+        # A partial bound covers the whole day/hour/minute it names
+        if filters.get("since"):
+            filters["since"] = normalize_time(filters["since"])
+        if filters.get("until"):
+            filters["until"] = normalize_time(filters["until"], _MAX_TIME)
+
+        rollup = self._rollup_for(filters.get("since"), filters.get("until"), bucket) if rollups else None
+        if rollup:
+            table, time_col, prefix = rollup
+            n = "SUM(n)"
+        else:
+            table, time_col, prefix, n = "findings", "window_start", len(_MIN_TIME), "COUNT(*)"
+        where, params = self._where(time_col, prefix, **filters)
+        # Rollups group on their own day/hour column, in primary key order;
+        # histogram() folds those into coarser buckets.
+        bucket_expr = time_col if rollup else f"substr({time_col}, 1, {BUCKET_PREFIX[bucket]})"
+        sql = select.format(n=n, bucket=bucket_expr) + f" FROM {table}{where} " + tail
+        return self.conn.execute(sql, params + list(extra)).fetchall()
+
+    def count(self, distinct: bool = False, **filters) -> int:
+        """
+        Number of findings matching the filters
+        (since, until, file_name, severity, category).
+        With distinct=True, counts incidents instead: findings sharing a
+        fingerprint, e.g. from overlapping cron windows, count once.
+        """
+        if distinct:
+            return self._query("SELECT COUNT(DISTINCT fingerprint)", "", "minute", filters, rollups=False)[0][0]
+        return self._query("SELECT {n}", "", "month", filters)[0][0] or 0
+
+    def top_categories(self, limit: int = 10, **filters) -> List[Tuple[str, int]]:
+        """
+        Most frequent categories, as (category, count) pairs.
+        """
+        return self._query(
+            "SELECT category, {n} AS total",
+            "GROUP BY category ORDER BY total DESC, category LIMIT ?",
+            "month",
+            filters,
+            [limit],
+        )
+
+    def histogram(self, bucket: str = "day", **filters) -> List[Tuple[str, int]]:
+        """
+        Findings per time bucket ('month', 'day', 'hour' or 'minute'),
+        as (bucket, count) pairs in time order.
+        """
+        if bucket not in BUCKET_PREFIX:
+            raise ValueError(f"Unknown bucket '{bucket}', expected one of {', '.join(BUCKET_PREFIX)}.")
+        rows = self._query(
+            "SELECT {bucket} AS b, {n}",
+            "GROUP BY b ORDER BY b",
+            bucket,
+            filters,
+        )
+        size = BUCKET_PREFIX[bucket]
+        folded: Dict[str, int] = {}
+        for b, n in rows:
+            folded[b[:size]] = folded.get(b[:size], 0) + n
+        return list(folded.items())
@@ -1,23 +1,62 @@
 # log_analyzer.py
 
 import os
+import sys
 import argparse
 from typing import List, Dict, Any
-from datetime import datetime,timedelta
 
-from constants import LOGS_DIR
-from log_reader import LogReader
-from chatgpt_client import ChatGPTClient
-from log_generator import SampleLogGenerator
-from email_sender import EmailSender
+from constants import LOGS_DIR, FINDINGS_DB
+from log_reader import LogReader, is_error_line, parse_time
 
+# chatgpt_client (openai), email_sender (smtplib), findings_store (sqlite3)
+# and log_generator are imported on first use so scan-only and offline runs start quickly.
 
 
 class LogAnalyzerApp:
-    def __init__(self, logs_dir: str):
+    def __init__(self, logs_dir: str, offline: bool = False, db_path: str = FINDINGS_DB):
         self.logs_dir = logs_dir
-        self.client = ChatGPTClient()
-        self.email_sender = EmailSender()
+        self.offline = offline
+        self.db_path = db_path
+        self._client = None
+        self._email_sender = None
+        self._store = None
+
+    @property
+    def client(self):
+        """
+        Analysis backend, created on first use.
+        OfflineClassifier when offline, otherwise ChatGPTClient.
+        """
+        if self._client is None:
+            if self.offline:
+                from offline_classifier import OfflineClassifier
+                self._client = OfflineClassifier()
+            else:
+                from chatgpt_client import ChatGPTClient
+                self._client = ChatGPTClient()
+        return self._client
+
+    @property
+    def email_sender(self):
+        if self._email_sender is None:
+            from email_sender import EmailSender
+            self._email_sender = EmailSender()
+        return self._email_sender
+
+    @property
+    def store(self):
+        if self._store is None:
+            from findings_store import FindingsStore
+            self._store = FindingsStore(self.db_path)
+        return self._store
+
+    def close(self):
+        """
+        Closes the findings store, if it was opened.
+        """
+        if self._store is not None:
+            self._store.close()
+            self._store = None
 
     def get_log_files(self,file_to_analyze) -> List[str]:
         """
@@ -40,11 +79,13 @@ class LogAnalyzerApp:
         self, file_path: str, start_time: str, end_time: str
     ) -> Dict[str, Any] | None:
         """
-        Filter logs by time, send to ChatGPT, return analysis.
+        Filter logs by time, send to the analysis client (ChatGPT, or
+        OfflineClassifier when offline), return analysis.
         If no lines in the window, returns None.
         """
         reader = LogReader(file_path)
-        snippet = reader.read_between(start_time, end_time)
+        lines = list(reader.iter_between(start_time, end_time))
+        snippet = "\n".join(lines)
 
         if not snippet.strip():
             # Nothing in this time window
@@ -58,9 +99,21 @@ class LogAnalyzerApp:
             end_time=end_time,
             context="Automated log analysis for failure detection.",
         )
+        # The model is asked to echo these back; keep what we actually know.
+        # The window is the span of the analyzed lines, not the requested
+        # bounds, so history queries bucket findings by when they happened.
+        result["file_name"] = file_name
+        result["time_window"] = {"start": lines[0][:19], "end": lines[-1][:19]}
         return result
 
-    def run(self, start_time: str, end_time: str, file_to_analyze:str, send_email: bool = True):
+    def run(
+        self,
+        start_time: str,
+        end_time: str,
+        file_to_analyze: str,
+        send_email: bool = True,
+        save: bool = True,
+    ):
         log_files = self.get_log_files(file_to_analyze)
         analyses: List[Dict[str, Any]] = []
 
@@ -84,44 +137,272 @@ class LogAnalyzerApp:
         elif not analyses:
             print("\nNo log entries found in the specified time window.\n")
 
+        # Persist for history/trend queries; a store failure must not
+        # cost the report, which has already been printed and sent.
+        if save and analyses:
+            import sqlite3
+
+            try:
+                saved = self.store.add_many(analyses)
+                print(f"\nSaved {saved} finding(s) to {self.store.db_path}")
+            except (sqlite3.Error, ValueError) as e:
+                print(f"\nCould not save findings to {self.db_path}: {e}", file=sys.stderr)
+            finally:
+                self.close()
+
+    def scan(self, start_time: str, end_time: str, file_to_analyze: str) -> Dict[str, List[str]]:
+        """
+        Returns the log lines in the time window per file, without any analysis.
+        Files with no lines in the window are left out.
+        """
+        matches: Dict[str, List[str]] = {}
+        for fpath in self.get_log_files(file_to_analyze):
+            lines = list(LogReader(fpath).iter_between(start_time, end_time))
+            if lines:
+                matches[os.path.basename(fpath)] = lines
+        return matches
+
+    def index(self, file_to_analyze: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns line/error counts and the covered time range per file.
+        """
+        return {
+            os.path.basename(fpath): LogReader(fpath).stats()
+            for fpath in sorted(self.get_log_files(file_to_analyze))
+        }
+
+
+def window_time(value: str) -> str:
+    """
+    argparse type for --start/--end: a usage error instead of a traceback,
+    and one normalized 'YYYY-MM-DD HH:MM:SS' value for every consumer.
+    """
+    try:
+        return parse_time(value).strftime("%Y-%m-%d %H:%M:%S")
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
 
-def parse_args() -> argparse.Namespace:
+
+def history_time(value: str) -> str:
+    """
+    argparse type for history --since/--until, which also accept partial times.
+    """
+    from findings_store import normalize_time
+
+    try:
+        normalize_time(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+    return value
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="AI-driven log analysis.")
     parser.add_argument(
-        "--start",
-        required=True,
-        help="Start time in 'YYYY-MM-DD HH:MM:SS' format",
+        "--logs-dir",
+        default=str(LOGS_DIR),
+        help="Directory containing the .log files (default: %(default)s).",
     )
     parser.add_argument(
-        "--end",
-        required=True,
-        help="End time in 'YYYY-MM-DD HH:MM:SS' format",
+        "--db",
+        default=str(FINDINGS_DB),
+        help="SQLite findings store (default: %(default)s).",
     )
-    parser.add_argument(
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    def add_file_arg(sub: argparse.ArgumentParser):
+        sub.add_argument(
+            "--file",
+            default="all",
+            help="Substring of the log file name to use, or 'all' (default).",
+        )
+
+    def add_window_args(sub: argparse.ArgumentParser):
+        sub.add_argument(
+            "--start",
+            required=True,
+            type=window_time,
+            help="Start time in 'YYYY-MM-DD HH:MM:SS' format",
+        )
+        sub.add_argument(
+            "--end",
+            required=True,
+            type=window_time,
+            help="End time in 'YYYY-MM-DD HH:MM:SS' format",
+        )
+        add_file_arg(sub)
+
+    scan = subparsers.add_parser("scan", help="Print log lines in a time window, no analysis.")
+    add_window_args(scan)
+    scan.add_argument(
+        "--errors-only",
+        action="store_true",
+        help="Only print ERROR lines.",
+    )
+
+    analyze = subparsers.add_parser("analyze", help="Analyze log lines in a time window.")
+    add_window_args(analyze)
+    analyze.add_argument(
         "--no-email",
         action="store_true",
         help="Do not send email, only print results.",
     )
-    return parser.parse_args()
+    analyze.add_argument(
+        "--offline",
+        action="store_true",
+        help="Classify with local keyword rules instead of ChatGPT.",
+    )
+    analyze.add_argument(
+        "--no-store",
+        action="store_true",
+        help="Do not save results to the findings store.",
+    )
+
+    generate = subparsers.add_parser("generate", help="Write sample log files.")
+    add_file_arg(generate)
+    generate.add_argument(
+        "--lines",
+        type=int,
+        default=60,
+        help="Minimum number of lines per generated file.",
+    )
+
+    index = subparsers.add_parser("index", help="Summarize lines, errors and time range per file.")
+    add_file_arg(index)
+
+    follow = subparsers.add_parser("follow", help="Print lines as they are appended to a log file.")
+    follow.add_argument("--file", required=True, help="Substring of the log file name to follow.")
+    follow.add_argument(
+        "--errors-only",
+        action="store_true",
+        help="Only print ERROR lines.",
+    )
+    follow.add_argument(
+        "--from-start",
+        action="store_true",
+        help="Print the existing content before following.",
+    )
+
+    history = subparsers.add_parser("history", help="Query saved findings without re-running analysis.")
+    history.add_argument(
+        "query",
+        choices=["count", "top-categories", "histogram"],
+        help="What to report.",
+    )
+    history.add_argument("--since", type=history_time, help="Window start at or after 'YYYY-MM-DD[ HH:MM:SS]'.")
+    history.add_argument("--until", type=history_time, help="Window start at or before 'YYYY-MM-DD[ HH:MM:SS]'.")
+    history.add_argument("--file", help="Log file name, e.g. db_timeout or db_timeout.log.")
+    history.add_argument("--severity", help="LOW, MEDIUM, HIGH or CRITICAL.")
+    history.add_argument("--category", help="e.g. DATABASE, NETWORK.")
+    history.add_argument(
+        "--bucket",
+        choices=["month", "day", "hour", "minute"],
+        default="day",
+        help="Histogram bucket size (default: %(default)s).",
+    )
+    history.add_argument(
+        "--limit",
+        type=int,
+        default=10,
+        help="Number of categories for top-categories (default: %(default)s).",
+    )
+    history.add_argument(
+        "--incidents",
+        action="store_true",
+        help="For count: count distinct incidents (by fingerprint) instead of findings.",
+    )
+
+    return parser.parse_args(argv)
+
+
+def run_history(args: argparse.Namespace) -> int:
+    import sqlite3
+    from findings_store import FindingsStore
+
+    file_name = args.file
+    if file_name and not file_name.endswith(".log"):
+        file_name += ".log"
+    filters = dict(
+        since=args.since,
+        until=args.until,
+        file_name=file_name,
+        severity=args.severity,
+        category=args.category,
+    )
+
+    try:
+        with FindingsStore(args.db) as store:
+            if args.query == "count":
+                print(store.count(distinct=args.incidents, **filters))
+            elif args.query == "top-categories":
+                for category, n in store.top_categories(limit=args.limit, **filters):
+                    print(f"{category}: {n}")
+            else:
+                for bucket, n in store.histogram(bucket=args.bucket, **filters):
+                    print(f"{bucket}  {n}")
+    except sqlite3.Error as e:
+        print(f"Could not read findings from {args.db}: {e}", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = parse_args(argv)
+    app = LogAnalyzerApp(args.logs_dir, offline=getattr(args, "offline", False), db_path=args.db)
+
+    if args.command == "history":
+        return run_history(args)
+
+    if args.command == "generate":
+        from pathlib import Path
+        from log_generator import SampleLogGenerator
+
+        Path(args.logs_dir).mkdir(exist_ok=True)
+        generator = SampleLogGenerator(args.logs_dir, total_lines=args.lines)
+        generator.generate_all(all="all" in args.file.lower(), specific_file=args.file)
+        return 0
+
+    if not os.path.isdir(args.logs_dir):
+        print(f"Logs directory not found: {args.logs_dir}", file=sys.stderr)
+        return 1
+
+    if args.command == "scan":
+        for file_name, lines in app.scan(args.start, args.end, args.file).items():
+            for line in lines:
+                if not args.errors_only or is_error_line(line):
+                    print(f"{file_name}: {line}")
+
+    elif args.command == "analyze":
+        app.run(
+            start_time=args.start,
+            end_time=args.end,
+            file_to_analyze=args.file,
+            send_email=not args.no_email,
+            save=not args.no_store,
+        )
+
+    elif args.command == "index":
+        for file_name, info in app.index(args.file).items():
+            print(
+                f"{file_name}: lines={info['lines']} errors={info['errors']} "
+                f"first={info['first']} last={info['last']}"
+            )
+
+    elif args.command == "follow":
+        log_files = app.get_log_files(args.file)
+        if len(log_files) != 1:
+            print(f"Expected exactly one file matching '{args.file}', found {len(log_files)}.", file=sys.stderr)
+            return 1
+        try:
+            for line in LogReader(log_files[0]).follow(from_start=args.from_start):
+                if not args.errors_only or is_error_line(line):
+                    print(line, flush=True)
+        except KeyboardInterrupt:
+            pass
+
+    return 0
 
 
 if __name__ == "__main__":
-    #args = parse_args()
-    send_email = True
-    all_files = False
-    specific_file  = "db_timeout"
-    LOGS_DIR.mkdir(exist_ok=True)
-    generator = SampleLogGenerator(LOGS_DIR, total_lines=60)
-    
-    #Get today's date
-    start_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    generator.generate_all(all=all_files, specific_file=specific_file)
-    end_time = (datetime.now()+timedelta(seconds=120)).strftime("%Y-%m-%d %H:%M:%S")
-    print("Start Time:", start_time)
-    print("End Time:  ", end_time)
-    app = LogAnalyzerApp(LOGS_DIR)
-    if all_files:
-        file_to_analyze = "all"
-    else:
-        file_to_analyze = specific_file
-    app.run(start_time=start_time, end_time=end_time, file_to_analyze = file_to_analyze, send_email=send_email)
+    sys.exit(main())
@@ -1,7 +1,33 @@
 # log_reader.py
 
+import os
+import time
 import datetime
-from typing import List
+from typing import Any, Dict, Iterator, List
+
+
+# Levels that mark a line as an error, shared by stats() and OfflineClassifier
+ERROR_LEVELS = ("ERROR", "FATAL", "CRITICAL")
+
+
+def is_error_line(line: str) -> bool:
+    return any(f" {level} " in line for level in ERROR_LEVELS)
+
+
+def parse_time(value: str) -> datetime.datetime:
+    """
+    Parses a 'YYYY-MM-DD HH:MM:SS' window bound.
+    fromisoformat handles this fixed format without loading _strptime, which
+    keeps startup fast. Timezone-aware values are rejected, since log
+    timestamps carry no offset and cannot be compared with them.
+    """
+    try:
+        dt = datetime.datetime.fromisoformat(value.strip())
+    except ValueError:
+        raise ValueError(f"Invalid time '{value}', expected 'YYYY-MM-DD HH:MM:SS'.") from None
+    if dt.tzinfo is not None:
+        raise ValueError(f"Invalid time '{value}', timezone offsets are not supported.")
+    return dt
 
 
 class LogReader:
@@ -13,16 +39,14 @@ class LogReader:
     def __init__(self, file_path: str):
         self.file_path = file_path
 
-    def read_between(self, start_time: str, end_time: str) -> str:
+    def iter_between(self, start_time: str, end_time: str) -> Iterator[str]:
         """
-        Returns the concatenated log lines between start_time and end_time (inclusive).
+        Yields log lines (without newline) between start_time and end_time (inclusive).
 
         start_time / end_time format: 'YYYY-MM-DD HH:MM:SS'
         """
-        start_dt = datetime.datetime.strptime(start_time, "%Y-%m-%d %H:%M:%S")
-        end_dt = datetime.datetime.strptime(end_time, "%Y-%m-%d %H:%M:%S")
-
-        selected_lines: List[str] = []
+        start_dt = parse_time(start_time)
+        end_dt = parse_time(end_time)
 
         with open(self.file_path, "r", encoding="utf-8") as f:
             for line in f:
@@ -30,12 +54,75 @@ class LogReader:
                     continue
                 ts_str = line[:19]
                 try:
-                    ts = datetime.datetime.strptime(ts_str, "%Y-%m-%d %H:%M:%S")
+                    ts = datetime.datetime.fromisoformat(ts_str)
                 except ValueError:
                     # Not a timestamp line, include only if we've started within window
                     continue
 
                 if start_dt <= ts <= end_dt:
-                    selected_lines.append(line.rstrip("\n"))
+                    yield line.rstrip("\n")
+
+    def read_between(self, start_time: str, end_time: str) -> str:
+        """
+        Returns the concatenated log lines between start_time and end_time (inclusive).
 
+        start_time / end_time format: 'YYYY-MM-DD HH:MM:SS'
+        """
+        selected_lines: List[str] = list(self.iter_between(start_time, end_time))
         return "\n".join(selected_lines)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns line count, error count and first/last timestamp of the file.
+        Timestamps are compared as strings, which is safe for the fixed format.
+        """
+        lines = errors = 0
+        first_ts = last_ts = None
+
+        with open(self.file_path, "r", encoding="utf-8") as f:
+            for line in f:
+                lines += 1
+                if is_error_line(line):
+                    errors += 1
+                ts_str = line[:19]
+                if len(ts_str) == 19 and ts_str[:4].isdigit() and ts_str[10] == " ":
+                    first_ts = first_ts or ts_str
+                    last_ts = ts_str
+
+        return {"lines": lines, "errors": errors, "first": first_ts, "last": last_ts}
+
+    def follow(self, from_start: bool = False, poll_interval: float = 0.5) -> Iterator[str]:
+        """
+        Yields lines as they are appended to the file, like `tail -f -F`.
+        Starts at the end of the file unless from_start is True, and reopens
+        the file from the start when it is truncated or rotated.
+        """
+        f = open(self.file_path, "r", encoding="utf-8")
+        try:
+            if not from_start:
+                f.seek(0, os.SEEK_END)
+            inode = os.fstat(f.fileno()).st_ino
+            pending = ""
+            while True:
+                line = f.readline()
+                if not line:
+                    time.sleep(poll_interval)
+                    try:
+                        st = os.stat(self.file_path)
+                    except FileNotFoundError:
+                        # Rotated away and not recreated yet
+                        continue
+                    if st.st_ino != inode or st.st_size < f.tell():
+                        f.close()
+                        f = open(self.file_path, "r", encoding="utf-8")
+                        inode = os.fstat(f.fileno()).st_ino
+                        pending = ""
+                    continue
+                pending += line
+                if not pending.endswith("\n"):
+                    # Writer is mid-line, wait for the rest of it
+                    continue
+                yield pending.rstrip("\n")
+                pending = ""
+        finally:
+            f.close()
@@ -0,0 +1,75 @@
+# offline_classifier.py
+
+import re
+from typing import Dict, Any, List, Tuple
+
+from log_reader import is_error_line
+
+
+# (pattern, category, severity) – checked in order against each error line,
+# so more specific failures must come before the generic code-logic ones.
+OFFLINE_RULES: List[Tuple[re.Pattern, str, str]] = [
+    (re.compile(r"OutOfMemoryError|No space left|insufficient disk", re.I), "RESOURCE_LIMIT", "CRITICAL"),
+    (re.compile(r"DB_TIMEOUT|timeout.*(connection|pool)|syntax error|SQL", re.I), "DATABASE", "HIGH"),
+    (re.compile(r"Connection ?refused|ConnectionError|Unreachable", re.I), "NETWORK", "HIGH"),
+    (re.compile(r"Authentication|invalid username or password|Unauthorized", re.I), "AUTHENTICATION", "MEDIUM"),
+    (re.compile(r"Missing required key|configuration error", re.I), "CONFIGURATION", "HIGH"),
+    (re.compile(r"\b5\d\d from|upstream", re.I), "EXTERNAL_DEPENDENCY", "HIGH"),
+    (re.compile(r"Traceback|TypeError|KeyError|NoneType|NullPointer", re.I), "CODE_LOGIC", "MEDIUM"),
+]
+
+OFFLINE_FIXES: Dict[str, List[str]] = {
+    "RESOURCE_LIMIT": ["Check memory/disk usage on the host.", "Raise the limit or reduce the workload size."],
+    "DATABASE": ["Check database health and connection pool settings.", "Review the failing query."],
+    "NETWORK": ["Verify the target service is up and reachable.", "Check host, port and firewall rules."],
+    "AUTHENTICATION": ["Verify the credentials in use.", "Check the account is not locked or expired."],
+    "CONFIGURATION": ["Add the missing configuration value.", "Validate config on startup."],
+    "EXTERNAL_DEPENDENCY": ["Check the status of the upstream service.", "Add retries or a fallback for the call."],
+    "CODE_LOGIC": ["Inspect the stack trace and the input that triggered it.", "Add validation for missing values."],
+    "UNKNOWN": ["Run the analysis online for a full root cause."],
+}
+
+
+class OfflineClassifier:
+    """
+    Keyword-based stand-in for ChatGPTClient.
+    Returns the same result schema without any network calls, for cron/hook
+    runs that only need a severity and category.
+    """
+
+    def analyze_log(
+        self,
+        file_name: str,
+        log_text: str,
+        start_time: str,
+        end_time: str,
+        context: str = "",
+    ) -> Dict[str, Any]:
+        """
+        Classifies the first error line matching a rule in OFFLINE_RULES.
+        """
+        error_lines = [line for line in log_text.splitlines() if is_error_line(line)]
+
+        category, severity, first_failure = "UNKNOWN", "LOW", ""
+        for line in error_lines:
+            for pattern, rule_category, rule_severity in OFFLINE_RULES:
+                if pattern.search(line):
+                    category, severity, first_failure = rule_category, rule_severity, line
+                    break
+            if first_failure:
+                break
+
+        if error_lines and not first_failure:
+            severity, first_failure = "MEDIUM", error_lines[0]
+
+        return {
+            "file_name": file_name,
+            "time_window": {"start": start_time, "end": end_time},
+            "severity": severity,
+            "category": category,
+            "ai_summary": first_failure[20:] if first_failure else "No error lines found in the time window.",
+            "root_cause": "Offline keyword classification; run without --offline for a full root cause.",
+            "suggested_fixes": OFFLINE_FIXES[category],
+            "error_highlights": error_lines[:10],
+            "additional_notes": "",
+        }
@@ -0,0 +1,201 @@
+# test_findings_store.py
+
+import pytest
+
+import findings_store
+from findings_store import FindingsStore, normalize_time
+from log_analyzer import LogAnalyzerApp
+
+
+FINDINGS = [
+    # (file_name, window_start, severity, category)
+    ("db_timeout.log", "2025-11-17 10:00:00", "CRITICAL", "DATABASE"),
+    ("db_timeout.log", "2025-11-17 10:30:15", "CRITICAL", "DATABASE"),
+    ("db_timeout.log", "2025-11-17 10:59:59", "HIGH", "DATABASE"),
+    ("db_timeout.log", "2025-11-17 23:45:00", "CRITICAL", "DATABASE"),
+    ("db_timeout.log", "2025-11-18 00:00:00", "CRITICAL", "DATABASE"),
+    ("auth_failure.log", "2025-11-17 10:05:00", "medium", "authentication"),
+    ("auth_failure.log", "2025-11-19T08:00:00", "MEDIUM", "AUTHENTICATION"),
+    ("network_connection_refused.log", "2025-11-23 12:00:00", "HIGH", "NETWORK"),
+]
+
+QUERIES = [
+    {},
+    {"until": "2025-11-17"},
+    {"since": "2025-11-17", "until": "2025-11-17"},
+    {"since": "2025-11-17 10", "until": "2025-11-17 10"},
+    {"since": "2025-11-17 10:00:00", "until": "2025-11-17 10:59:59"},
+    {"since": "2025-11-17 10:30", "until": "2025-11-18"},
+    {"file_name": "db_timeout.log", "category": "database", "severity": "CRITICAL"},
+    {"severity": "MEDIUM", "until": "2025-11-19"},
+    {"since": "2025-11-17 10:00:00.000", "until": "2025-11-17T23:59:59"},
+]
+
+PATHS = {
+    "daily": findings_store.ROLLUPS,
+    "hourly": findings_store.ROLLUPS[1:],
+    "findings": [],
+}
+
+
+def make_result(file_name, start, severity, category):
+    return {
+        "file_name": file_name,
+        "time_window": {"start": start, "end": start},
+        "severity": severity,
+        "category": category,
+        "ai_summary": "summary",
+        "error_highlights": [f"{start} ERROR [X] failure"],
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    with FindingsStore(tmp_path / "findings.db") as store:
+        store.add_many([make_result(*f) for f in FINDINGS])
+        yield store
+
+
+@pytest.mark.parametrize("filters", QUERIES)
+def test_rollup_and_findings_paths_agree(store, monkeypatch, filters):
+    answers = {}
+    for path, rollups in PATHS.items():
+        monkeypatch.setattr(findings_store, "ROLLUPS", rollups)
+        answers[path] = (
+            store.count(**filters),
+            store.top_categories(**filters),
+            store.histogram(bucket="month", **filters),
+            store.histogram(bucket="day", **filters),
+            store.histogram(bucket="hour", **filters),
+        )
+    assert answers["daily"] == answers["hourly"] == answers["findings"]
+
+
+def test_unbounded_day_queries_use_daily_rollup(store):
+    assert FindingsStore._rollup_for(bucket="day")[0] == "finding_counts_daily"
+    assert FindingsStore._rollup_for(until="2025-11-17 10:59:59", bucket="day")[0] == "finding_counts"
+    assert FindingsStore._rollup_for(bucket="minute") is None
+
+
+def test_date_only_until_covers_whole_day(store):
+    assert store.count(since="2025-11-17", until="2025-11-17") == 5
+    assert store.count(file_name="db_timeout.log", until="2025-11-17") == 4
+
+
+def test_partial_hour_bound_covers_whole_hour(store):
+    assert store.count(since="2025-11-17 10", until="2025-11-17 10") == 4
+    assert store.histogram(bucket="minute", since="2025-11-17 10", until="2025-11-17 10") == [
+        ("2025-11-17 10:00", 1),
+        ("2025-11-17 10:05", 1),
+        ("2025-11-17 10:30", 1),
+        ("2025-11-17 10:59", 1),
+    ]
+
+
+def test_labels_and_iso_times_are_normalized(store):
+    assert store.count(severity="MEDIUM", category="AUTHENTICATION") == 2
+    assert store.histogram(bucket="day", file_name="auth_failure.log") == [
+        ("2025-11-17", 1),
+        ("2025-11-19", 1),
+    ]
+
+
+@pytest.mark.parametrize("value", ["2025-11", "abcdefghij", "2025-11-17T10:00:00+00:00"])
+def test_bad_bound_is_rejected(store, value):
+    with pytest.raises(ValueError, match="Invalid time"):
+        store.count(since=value)
+
+
+def test_normalize_time():
+    assert normalize_time("2025-11-17") == "2025-11-17 00:00:00"
+    assert normalize_time("2025-11-17 10", findings_store._MAX_TIME) == "2025-11-17 10:59:59"
+    assert normalize_time("2025-11-23 23:00:00.000") == "2025-11-23 23:00:00"
+
+
+def test_distinct_counts_incidents_once(store):
+    repeat = make_result("db_timeout.log", "2025-11-17 10:30:15", "CRITICAL", "DATABASE")
+    store.add_many([repeat, repeat])
+    filters = {"file_name": "db_timeout.log", "category": "DATABASE", "since": "2025-11-17 10"}
+    assert store.count(**filters) == 7
+    # Highlights differ only in their timestamps, so every row is one incident
+    assert store.count(distinct=True, **filters) == 1
+    assert store.count(distinct=True) == 3
+
+
+def test_v1_database_is_migrated(tmp_path):
+    path = tmp_path / "findings.db"
+    with FindingsStore(path) as store:
+        store.add_many([make_result(*f) for f in FINDINGS])
+        store.conn.executescript(
+            "DELETE FROM finding_counts_daily;"
+            "CREATE INDEX idx_findings_category ON findings (category, window_start, severity);"
+            "PRAGMA user_version = 1;"
+        )
+    with FindingsStore(path) as store:
+        assert store.histogram(bucket="day") == [
+            ("2025-11-17", 5),
+            ("2025-11-18", 1),
+            ("2025-11-19", 1),
+            ("2025-11-23", 1),
+        ]
+        indexes = {row[0] for row in store.conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert "idx_findings_category" not in indexes
+
+
+def test_null_fields_are_stored_as_unknown(store):
+    store.add_many([{
+        "file_name": None,
+        "time_window": None,
+        "severity": None,
+        "category": None,
+        "error_highlights": None,
+    }])
+    assert store.count(severity="UNKNOWN", category="UNKNOWN") == 1
+    assert store.count() == len(FINDINGS) + 1
+
+
+class FakeClient:
+    def analyze_log(self, file_name, log_text, start_time, end_time, context=""):
+        return {"file_name": None, "time_window": None, "severity": None, "category": "database"}
+
+
+class FakeEmailSender:
+    def __init__(self):
+        self.sent = []
+
+    def send_report(self, analyses):
+        self.sent.append(analyses)
+
+
+def test_run_saves_known_file_and_line_window(tmp_path):
+    (tmp_path / "db_timeout.log").write_text(
+        "2025-11-17 10:00:00 ERROR [DBPool] Timeout\n"
+        "2025-11-17 10:20:00 ERROR [Api] DB_TIMEOUT\n"
+    )
+    app = LogAnalyzerApp(str(tmp_path), db_path=str(tmp_path / "findings.db"))
+    app._client = FakeClient()
+    app._email_sender = FakeEmailSender()
+
+    app.run("2000-01-01 00:00:00", "2100-01-01 00:00:00", "all")
+
+    assert len(app._email_sender.sent) == 1
+    assert app._email_sender.sent[0][0]["time_window"] == {
+        "start": "2025-11-17 10:00:00",
+        "end": "2025-11-17 10:20:00",
+    }
+    # run() closes the store; reading reopens it
+    assert app._store is None
+    assert app.store.count(file_name="db_timeout.log", category="DATABASE", since="2025-11-17 10") == 1
+    assert app.store.histogram(bucket="month") == [("2025-11", 1)]
+    app.close()
+
+
+def test_store_failure_does_not_stop_report(tmp_path):
+    (tmp_path / "db_timeout.log").write_text("2025-11-17 10:00:00 ERROR [DBPool] Timeout\n")
+    app = LogAnalyzerApp(str(tmp_path), db_path=str(tmp_path / "missing" / "findings.db"))
+    app._client = FakeClient()
+    app._email_sender = FakeEmailSender()
+
+    app.run("2025-11-17 09:00:00", "2025-11-17 11:00:00", "all")
+
+    assert len(app._email_sender.sent) == 1
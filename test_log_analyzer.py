@@ -0,0 +1,75 @@
+# test_log_analyzer.py
+
+import pytest
+
+from log_analyzer import main
+
+
+LOG = (
+    "2025-11-17 10:00:00 INFO [DBPool] heartbeat\n"
+    "2025-11-17 10:00:01 ERROR [DBPool] Timeout: failed to obtain connection from pool\n"
+    "2025-11-17 10:00:02 FATAL [Api] Failed to fetch positions: DB_TIMEOUT\n"
+    "2025-11-17 10:00:03 INFO [DBPool] heartbeat\n"
+)
+
+WINDOW = ["--start", "2025-11-17 10:00:00", "--end", "2025-11-17 10:00:03"]
+
+
+@pytest.fixture
+def logs_dir(tmp_path):
+    (tmp_path / "db_timeout.log").write_text(LOG, encoding="utf-8")
+    (tmp_path / "other.txt").write_text(LOG, encoding="utf-8")
+    return str(tmp_path)
+
+
+def test_scan_prints_window(logs_dir, capsys):
+    assert main(["--logs-dir", logs_dir, "scan", *WINDOW]) == 0
+    out = capsys.readouterr().out.splitlines()
+    assert len(out) == 4
+    assert all(line.startswith("db_timeout.log: ") for line in out)
+
+
+def test_scan_errors_only(logs_dir, capsys):
+    assert main(["--logs-dir", logs_dir, "scan", *WINDOW, "--errors-only"]) == 0
+    out = capsys.readouterr().out.splitlines()
+    assert [line.split()[3] for line in out] == ["ERROR", "FATAL"]
+
+
+def test_index(logs_dir, capsys):
+    assert main(["--logs-dir", logs_dir, "index"]) == 0
+    assert capsys.readouterr().out.strip() == (
+        "db_timeout.log: lines=4 errors=2 first=2025-11-17 10:00:00 last=2025-11-17 10:00:03"
+    )
+
+
+def test_analyze_offline_without_email_or_store(logs_dir, tmp_path, capsys):
+    db = tmp_path / "findings.db"
+    args = ["--logs-dir", logs_dir, "--db", str(db), "analyze", *WINDOW, "--no-email", "--offline", "--no-store"]
+    assert main(args) == 0
+    assert "Severity: HIGH | Category: DATABASE" in capsys.readouterr().out
+    assert not db.exists()
+
+
+def test_missing_logs_dir(tmp_path, capsys):
+    assert main(["--logs-dir", str(tmp_path / "missing"), "index"]) == 1
+    assert "Logs directory not found" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("start", ["bad", "2025-11-17T10:00:00+00:00"])
+def test_bad_window_is_a_usage_error(logs_dir, start, capsys):
+    with pytest.raises(SystemExit) as exc:
+        main(["--logs-dir", logs_dir, "scan", "--start", start, "--end", "2025-11-17 10:00:03"])
+    assert exc.value.code == 2
+    assert "argument --start" in capsys.readouterr().err
+
+
+def test_unreadable_db_is_reported(tmp_path, capsys):
+    assert main(["--db", str(tmp_path / "missing" / "findings.db"), "history", "count"]) == 1
+    assert "Could not read findings" in capsys.readouterr().err
+
+
+def test_bad_history_bound_is_a_usage_error(tmp_path, capsys):
+    with pytest.raises(SystemExit) as exc:
+        main(["--db", str(tmp_path / "findings.db"), "history", "count", "--since", "2025-11"])
+    assert exc.value.code == 2
+    assert "argument --since" in capsys.readouterr().err
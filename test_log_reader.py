@@ -0,0 +1,97 @@
+# test_log_reader.py
+
+import os
+
+import pytest
+
+from log_reader import LogReader, is_error_line, parse_time
+
+
+LINES = [
+    "2025-11-17 09:59:59 INFO [App] before window",
+    "2025-11-17 10:00:00 INFO [App] start",
+    "    continuation line without timestamp",
+    "2025-11-17 10:00:01 ERROR [App] failure",
+    "2025-11-17 10:00:02 FATAL [App] fatal failure",
+    "2025-11-17 10:00:03 CRITICAL [App] critical failure",
+    "2025-11-17 10:00:04 WARN [App] ERROR-free warning",
+    "2025-11-17 10:00:05 INFO [App] end",
+    "2025-11-17 10:00:06 INFO [App] after window",
+]
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    path = tmp_path / "app.log"
+    path.write_text("\n".join(LINES) + "\n", encoding="utf-8")
+    return str(path)
+
+
+def test_iter_between_is_inclusive(log_file):
+    lines = list(LogReader(log_file).iter_between("2025-11-17 10:00:00", "2025-11-17 10:00:05"))
+    assert lines[0].endswith("start")
+    assert lines[-1].endswith("end")
+    assert len(lines) == 6
+
+
+def test_read_between_joins_lines(log_file):
+    text = LogReader(log_file).read_between("2025-11-17 10:00:01", "2025-11-17 10:00:02")
+    assert text == "\n".join(LINES[3:5])
+
+
+def test_stats_counts_all_error_levels(log_file):
+    assert LogReader(log_file).stats() == {
+        "lines": len(LINES),
+        "errors": 3,
+        "first": "2025-11-17 09:59:59",
+        "last": "2025-11-17 10:00:06",
+    }
+
+
+def test_is_error_line():
+    assert is_error_line(LINES[3])
+    assert is_error_line(LINES[4])
+    assert is_error_line(LINES[5])
+    assert not is_error_line(LINES[6])
+
+
+@pytest.mark.parametrize("value", ["bad", "2025-11", "2025-11-17T10:00:00+00:00"])
+def test_parse_time_rejects_bad_and_aware_values(value):
+    with pytest.raises(ValueError):
+        parse_time(value)
+
+
+def test_follow_survives_rotation_and_truncation(tmp_path):
+    path = tmp_path / "app.log"
+    path.write_text("2025-11-17 10:00:00 INFO first\n", encoding="utf-8")
+    lines = LogReader(str(path)).follow(from_start=True, poll_interval=0.01)
+
+    assert next(lines).endswith("first")
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("2025-11-17 10:00:01 ERROR appended\n")
+    assert next(lines).endswith("appended")
+
+    # logrotate-style rename, then a fresh file at the same path
+    os.rename(path, tmp_path / "app.log.1")
+    path.write_text("2025-11-17 10:00:02 INFO after rotate\n", encoding="utf-8")
+    assert next(lines).endswith("after rotate")
+
+    # copytruncate-style: same inode, shorter content
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("x\n")
+    assert next(lines) == "x"
+
+    lines.close()
+
+
+def test_follow_waits_for_complete_line(tmp_path):
+    path = tmp_path / "app.log"
+    path.write_text("2025-11-17 10:00:00 INFO partial", encoding="utf-8")
+    lines = LogReader(str(path)).follow(from_start=True, poll_interval=0.01)
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(" line\n")
+    assert next(lines) == "2025-11-17 10:00:00 INFO partial line"
+
+    lines.close()
@@ -0,0 +1,77 @@
+# test_offline_classifier.py
+
+import os
+
+import pytest
+
+from offline_classifier import OfflineClassifier
+
+
+SAMPLES_DIR = os.path.dirname(os.path.abspath(__file__))
+
+EXPECTED = [
+    ("auth_failure.log", "AUTHENTICATION", "MEDIUM"),
+    ("config_missing_key.log", "CONFIGURATION", "HIGH"),
+    ("db_timeout.log", "DATABASE", "HIGH"),
+    ("disk_space_full.log", "RESOURCE_LIMIT", "CRITICAL"),
+    ("generic_stacktrace.log", "CODE_LOGIC", "MEDIUM"),
+    ("network_connection_refused.log", "NETWORK", "HIGH"),
+    ("null_pointer_error.log", "CODE_LOGIC", "MEDIUM"),
+    ("out_of_memory.log", "RESOURCE_LIMIT", "CRITICAL"),
+    ("service_dependency_error.log", "EXTERNAL_DEPENDENCY", "HIGH"),
+    ("sql_syntax_error.log", "DATABASE", "HIGH"),
+]
+
+
+def analyze(text, file_name="app.log"):
+    return OfflineClassifier().analyze_log(
+        file_name=file_name,
+        log_text=text,
+        start_time="2025-11-17 00:00:00",
+        end_time="2025-11-17 23:59:59",
+    )
+
+
+@pytest.mark.parametrize("file_name, category, severity", EXPECTED)
+def test_sample_logs_are_classified(file_name, category, severity):
+    with open(os.path.join(SAMPLES_DIR, file_name), "r", encoding="utf-8") as f:
+        result = analyze(f.read(), file_name)
+
+    assert (result["category"], result["severity"]) == (category, severity)
+    assert result["file_name"] == file_name
+    assert result["error_highlights"]
+
+
+def test_first_matching_error_line_wins():
+    result = analyze(
+        "2025-11-17 10:00:00 ERROR [Pool] Timeout: failed to obtain connection from pool\n"
+        "2025-11-17 10:00:01 ERROR [Api] TypeError: 'NoneType' object is not subscriptable\n"
+    )
+    assert result["category"] == "DATABASE"
+    assert result["ai_summary"] == "ERROR [Pool] Timeout: failed to obtain connection from pool"
+
+
+def test_specific_rule_beats_code_logic_on_same_line():
+    result = analyze("2025-11-17 10:00:00 ERROR [Job] java.lang.OutOfMemoryError in Traceback\n")
+    assert (result["category"], result["severity"]) == ("RESOURCE_LIMIT", "CRITICAL")
+
+
+def test_fatal_and_critical_lines_count_as_errors():
+    result = analyze(
+        "2025-11-17 10:00:00 INFO [App] Connection refused is only a warning here\n"
+        "2025-11-17 10:00:01 FATAL [App] ConnectionError: [Errno 111] Connection refused\n"
+        "2025-11-17 10:00:02 CRITICAL [App] Shutting down\n"
+    )
+    assert result["category"] == "NETWORK"
+    assert len(result["error_highlights"]) == 2
+
+
+def test_unmatched_errors_are_unknown_medium():
+    result = analyze("2025-11-17 10:00:00 ERROR [App] Something odd happened\n")
+    assert (result["category"], result["severity"]) == ("UNKNOWN", "MEDIUM")
+
+
+def test_no_errors_is_unknown_low():
+    result = analyze("2025-11-17 10:00:00 INFO [App] All good\n")
+    assert (result["category"], result["severity"]) == ("UNKNOWN", "LOW")
+    assert result["error_highlights"] == []